@@ -1,9 +1,11 @@
 import time
 import socket
+import functools
 import psutil
 import os
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-from st7735s import ST7735S
+from st7735s import ST7735S, rgb_to_565
 
 # --------------------------------------------------
 # CONFIGURATION & STYLE
@@ -13,10 +15,27 @@ ROTATION = 270
 WIDTH = 160
 HEIGHT = 80
 UPDATE_INTERVAL = 1.0
+SPI_SPEED_HZ = 32_000_000  # drop to 24_000_000 if the panel shows noise
 
-SCALE = 2  # high DPI supersampling
+# Sampling intervals (seconds) for slower-moving metrics; CPU is read every frame
+RAM_INTERVAL = 2.0
+NET_INTERVAL = 2.0
+TEMP_INTERVAL = 5.0
+HOST_INTERVAL = 60.0
+
+# Low-pass weight for new CPU samples (psutil readings jitter frame to frame)
+CPU_EMA_ALPHA = 0.3
 
 FONT_PATH = os.path.expanduser("~/.fonts/0xProtoNerdFontMono-Regular.ttf")
+TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+NET_DEV_PATH = "/proc/net/dev"
+
+# Layout (native panel pixels). The old supersampled canvas was 2x wide but
+# (HEIGHT + 6) * 2 tall, so y positions are scaled by 80/172, not halved;
+# this keeps the bottom margin that prevents footer text clipping.
+ROW_1_Y = 23
+ROW_2_Y = 40
+FOOTER_Y = 60  # Text baseline
 
 THEME = {
     "bg": "#000000",
@@ -28,33 +47,92 @@ THEME = {
     "accent_yellow": "#FFD60A",
     "accent_red": "#FF453A",
     "accent_purple": "#BF5AF2",
+    "footer_bg": "#510909",
 }
 
+# --------------------------------------------------
+# VALUE FORMATTING
+# --------------------------------------------------
+# Displayed values are small bounded integers, so each string is built once
+# and then served from a cache.
+
+@functools.lru_cache(maxsize=1024)
+def format_mb(value):
+    if value >= 1000:
+        gb = value / 1024
+        return f"{gb:.1f}GB"
+    else:
+        return f"{value}MB"
+
+@functools.lru_cache(maxsize=256)
+def format_temp(value):
+    return f"{value}°"
+
+@functools.lru_cache(maxsize=256)
+def format_percent(value):
+    return f"{value}%"
+
 # --------------------------------------------------
 # SYSTEM MONITOR CLASS
 # --------------------------------------------------
 
 class SystemMonitor:
     def __init__(self):
-        self.display = ST7735S(rotation=ROTATION, x_offset=24, y_offset=0, debug=False)
+        self.display = ST7735S(rotation=ROTATION, x_offset=24, y_offset=0,
+                               speed_hz=SPI_SPEED_HZ, debug=False)
         self.width = self.display.width
         self.height = self.display.height
 
-        # Expanded slightly to prevent footer clipping
-        self.v_width = self.width * SCALE
-        self.v_height = (self.height + 6) * SCALE
-
-        # Load scaled fonts
+        # Fonts are rasterized at panel size; freetype already anti-aliases
+        # the glyphs, so there is no need to supersample the whole frame.
         self.fonts = {
-            "header": self._load_font(14 * SCALE),
-            "value":  self._load_font(14 * SCALE),
-            "icon":   self._load_font(18 * SCALE),
-            "net":    self._load_font(12 * SCALE),
-            "net_icon": self._load_font(20 * SCALE), 
+            "header": self._load_font(14),
+            "value":  self._load_font(14),
+            "icon":   self._load_font(18),
+            "net":    self._load_font(12),
+            "net_icon": self._load_font(20),
+        }
+
+        # Pre-rasterized alpha tiles for the characters live values use,
+        # so hot text is pasted instead of going through freetype each frame
+        self._glyphs = {
+            "value":  self._render_glyphs(self.fonts["value"], "0123456789.%MBG"),
+            "header": self._render_glyphs(self.fonts["header"], "-0123456789°"),
         }
+        # (font_key, color, bg) -> RGB565 tiles, built on first use
+        self._tiles = {}
+
+        self._color565 = {c: rgb_to_565(c) for c in THEME.values()}
 
         # SLIM PROGRESS BAR HEIGHT
-        self.BAR_HEIGHT = 8 * SCALE
+        self.BAR_HEIGHT = 7
+
+        # Static chrome (icons, hostname, footer) is rendered once into an
+        # RGB565 framebuffer and copied each frame; only the live values
+        # are drawn on top, directly in the panel's pixel format.
+        self.host = socket.gethostname()[:12]
+        self._base_fb = self._render_base()
+
+        # Persistent frame surface, reset from the base in place each frame
+        # (display_async snapshots it, so it can be reused immediately)
+        self._fb = self._base_fb.copy()
+
+        # Thermal zone and net counters stay open; they are re-read with pread()
+        try:
+            self._temp_fd = os.open(TEMP_PATH, os.O_RDONLY)
+        except OSError:
+            self._temp_fd = None
+        try:
+            self._net_fd = os.open(NET_DEV_PATH, os.O_RDONLY)
+        except OSError:
+            self._net_fd = None
+
+        # key -> (monotonic timestamp, value) for rate-limited samples
+        self._cached = {"host": (time.monotonic(), self.host)}
+
+        self._cpu_ema = None
+        # Displayed (cpu, ram, temp, down, up) of the last drawn frame
+        self._last = None
 
     def _load_font(self, size):
         try:
@@ -62,114 +140,261 @@ class SystemMonitor:
         except:
             return ImageFont.load_default()
 
+    def _rasterize(self, font, text):
+        """Render text into an L-mode alpha mask; returns (mask, x offset)."""
+        x0, _, x1, y1 = font.getbbox(text)
+        ox = max(0, -x0)
+        mask = Image.new("L", (max(1, x1 + ox), max(1, y1)), 0)
+        ImageDraw.Draw(mask).text((ox, 0), text, font=font, fill=255)
+        return mask, ox
+
+    def _render_glyphs(self, font, chars):
+        """Rasterize each char once: char -> (L mask, x offset, advance)."""
+        tiles = {}
+        for c in chars:
+            mask, ox = self._rasterize(font, c)
+            tiles[c] = (mask, ox, font.getlength(c))
+        return tiles
+
+    def _to_565_tile(self, mask, color, bg):
+        """Blend color over a solid bg through mask; returns (bool mask, RGB565 pixels)."""
+        tile = Image.new("RGB", mask.size, bg)
+        tile.paste(color, (0, 0), mask)
+        return np.asarray(mask) > 0, self.display.image_to_rgb565(tile)
+
+    def _tiles_565(self, font_key, color, bg):
+        key = (font_key, color, bg)
+        tiles = self._tiles.get(key)
+        if tiles is None:
+            tiles = {
+                c: self._to_565_tile(mask, color, bg) + (ox, advance)
+                for c, (mask, ox, advance) in self._glyphs[font_key].items()
+            }
+            self._tiles[key] = tiles
+        return tiles
+
+    def _blit_tile(self, fb, x, y, mask, pixels):
+        """Copy the masked pixels of a tile into fb at (x, y), clipped to the panel."""
+        h, w = mask.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        np.copyto(
+            fb[y0:y1, x0:x1],
+            pixels[y0 - y:y1 - y, x0 - x:x1 - x],
+            where=mask[y0 - y:y1 - y, x0 - x:x1 - x],
+        )
+
+    def _text_width(self, text, font_key):
+        tiles = self._glyphs[font_key]
+        if any(c not in tiles for c in text):
+            return self.fonts[font_key].getlength(text)
+        return sum(tiles[c][2] for c in text)
+
+    def _paste_text(self, fb, xy, text, font_key, color, bg):
+        """
+        Draw text into the RGB565 framebuffer from cached glyph tiles.
+
+        Tiles are pre-blended over `bg`, so text must sit on that solid
+        colour. Strings with uncached chars are rasterized as a one-off tile.
+        """
+        x, y = xy
+        tiles = self._tiles_565(font_key, color, bg) if font_key in self._glyphs else {}
+        if any(c not in tiles for c in text):
+            mask, ox = self._rasterize(self.fonts[font_key], text)
+            self._blit_tile(fb, round(x) - ox, y, *self._to_565_tile(mask, color, bg))
+            return
+
+        for c in text:
+            mask, pixels, ox, advance = tiles[c]
+            self._blit_tile(fb, round(x) - ox, y, mask, pixels)
+            x += advance
+
     def get_temp(self):
-        try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                return int(f.read().strip()) / 1000.0
-        except:
+        if self._temp_fd is None:
             return 0.0
+        try:
+            return int(os.pread(self._temp_fd, 16, 0).strip()) / 1000.0
+        except (OSError, ValueError):
+            # e.g. EAGAIN while the sensor is busy; skip this sample
+            return None
+
+    def get_net_bytes(self):
+        """Total (recv, sent) bytes over all non-loopback interfaces."""
+        if self._net_fd is None:
+            per_nic = psutil.net_io_counters(pernic=True)
+            recv = sum(n.bytes_recv for name, n in per_nic.items() if name != "lo")
+            sent = sum(n.bytes_sent for name, n in per_nic.items() if name != "lo")
+            return recv, sent
+
+        # Read to EOF: /proc returns about a page per read whatever the
+        # buffer size, and sequential reads continue the same listing
+        chunks = []
+        try:
+            os.lseek(self._net_fd, 0, os.SEEK_SET)
+            while True:
+                chunk = os.read(self._net_fd, 4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return None
+        data = b"".join(chunks)
+
+        recv = sent = 0
+        # Two header lines, then "iface: rx_bytes ... (8 rx cols) tx_bytes ..."
+        for line in data.splitlines()[2:]:
+            name, _, fields = line.partition(b":")
+            if name.strip() == b"lo":
+                continue
+            cols = fields.split()
+            try:
+                rx, tx = int(cols[0]), int(cols[8])
+            except (IndexError, ValueError):
+                continue
+            recv += rx
+            sent += tx
+        return recv, sent
+
+    def _sample(self, key, interval, read, now, default=None):
+        ts, value = self._cached.get(key, (None, default))
+        if ts is None or now - ts >= interval:
+            new = read()
+            # A failed read (None) keeps the last good value and is retried
+            # on the next frame rather than cached for the whole interval
+            if new is not None:
+                value = new
+                self._cached[key] = (now, value)
+        return value
 
     def get_color_by_usage(self, value):
         if value >= 80: return THEME["accent_red"]
         if value >= 60: return THEME["accent_yellow"]
         return THEME["accent_green"]
 
-    def draw_progress_bar(self, draw, x, y, w, percent, color):
+    def draw_progress_bar(self, fb, x, y, w, percent, color):
         h = self.BAR_HEIGHT
 
-        # Background
-        draw.rectangle((x, y, x + w, y + h), fill=THEME["bar_bg"])
+        # Background (w/h are inclusive extents, hence the +1)
+        ST7735S.fill_rect_565(fb, x, y, w + 1, h + 1, self._color565[THEME["bar_bg"]])
 
         # Fill amount
-        fill_w = max(int(w * (percent / 100)), 3 * SCALE)
+        fill_w = max(int(w * (percent / 100)), 3)
+
+        ST7735S.fill_rect_565(fb, x, y, fill_w + 1, h + 1, self._color565[color])
+
+    # --------------------------------------------------
+    # STATIC CHROME
+    # --------------------------------------------------
+
+    def _render_base(self):
+        bg = THEME["bg"]
+        fb = np.empty((self.height, self.width), dtype=">u2")
+        fb[...] = self._color565[bg]
+
+        # Header: Linux icon + hostname
+        self._paste_text(fb, (4, 1), u'\ue712', "icon", THEME["text_dim"], bg)
+        self._paste_text(fb, (21, 3), self.host, "header", THEME["text_main"], bg)
+
+        # Row icons
+        self._paste_text(fb, (6, ROW_1_Y-3), "󰍛", "icon", THEME["text_dim"], bg)
+        self._paste_text(fb, (6, ROW_2_Y-3), "", "icon", THEME["text_dim"], bg)
+
+        # --------------------------------------------------
+        # NETWORK FOOTER — WITH LIGHT GREY BACKGROUND
+        # --------------------------------------------------
+        footer_height = 40              # Adjustable height
+        footer_top = FOOTER_Y - 2       # Adjust spacing above icons
+
+        # Footer background (colour: THEME["footer_bg"])
+        ST7735S.fill_rect_565(fb, 0, footer_top, self.width, footer_height + 1,
+                              self._color565[THEME["footer_bg"]])
+
+        # Icons that always work in Nerd Fonts
+        down_icon = u'\ueb6e' # Material Design Download icon
+        up_icon   = u'\ueb71' # Material Design Upload icon
+
+        self._paste_text(fb, (11, FOOTER_Y-2), down_icon, "net_icon",
+                         THEME["accent_blue"], THEME["footer_bg"])
+        self._paste_text(fb, (85, FOOTER_Y-2), up_icon, "net_icon",
+                         THEME["accent_purple"], THEME["footer_bg"])
 
-        draw.rectangle((x, y, x + fill_w, y + h), fill=color)
+        return fb
 
     # --------------------------------------------------
     # RENDER FRAME
     # --------------------------------------------------
 
     def render_frame(self):
-        img = Image.new("RGB", (self.v_width, self.v_height), THEME["bg"])
-        draw = ImageDraw.Draw(img)
-
-        cpu = psutil.cpu_percent(None)
-        ram = psutil.virtual_memory().percent
-        temp = self.get_temp()
+        now = time.monotonic()
+
+        host = self._sample("host", HOST_INTERVAL, lambda: socket.gethostname()[:12], now)
+        if host != self.host:
+            self.host = host
+            self._base_fb = self._render_base()
+            self._last = None
+
+        cpu_raw = psutil.cpu_percent(None)
+        if self._cpu_ema is None:
+            self._cpu_ema = cpu_raw
+        else:
+            self._cpu_ema = CPU_EMA_ALPHA * cpu_raw + (1 - CPU_EMA_ALPHA) * self._cpu_ema
+
+        # Everything below is drawn from these rounded values, so an
+        # unchanged tuple means an identical frame: skip render and blit.
+        cpu = round(self._cpu_ema)
+        ram = round(self._sample("ram", RAM_INTERVAL, lambda: psutil.virtual_memory().percent, now))
+        temp = round(self._sample("temp", TEMP_INTERVAL, self.get_temp, now, 0.0))
 
         # Network (rounded MB, no decimals)
-        net = psutil.net_io_counters()
-        down = int(net.bytes_recv / (1024 * 1024))
-        up   = int(net.bytes_sent / (1024 * 1024))
+        recv, sent = self._sample("net", NET_INTERVAL, self.get_net_bytes, now, (0, 0))
+        down = int(recv / (1024 * 1024))
+        up   = int(sent / (1024 * 1024))
+
+        # Still push an unchanged frame if the driver lost track of the
+        # panel (e.g. SPI recovery reset it), so it gets redrawn in full
+        values = (cpu, ram, temp, down, up)
+        if values == self._last and not self.display.needs_full_redraw:
+            return
+        self._last = values
 
-        host = socket.gethostname()[:12]
+        fb = self._fb
+        np.copyto(fb, self._base_fb)
 
         # --------------------------------------------------
         # HEADER
         # --------------------------------------------------
-        draw.text((8, 3), u'\ue712', font=self.fonts["icon"], fill=THEME["text_dim"])
-        draw.text((42, 6), host, font=self.fonts["header"], fill=THEME["text_main"])
-
         temp_color = self.get_color_by_usage((temp - 30) * 2)
-        temp_str = f"{temp:.0f}°"
-        t_w = draw.textlength(temp_str, font=self.fonts["header"])
-        draw.text((self.v_width - t_w - 10, 6), temp_str,
-                  font=self.fonts["header"], fill=temp_color)
+        temp_str = format_temp(temp)
+        t_w = self._text_width(temp_str, "header")
+        self._paste_text(fb, (round(self.width - t_w - 5), 3), temp_str, "header",
+                         temp_color, THEME["bg"])
 
         # --------------------------------------------------
         # CPU ROW
         # --------------------------------------------------
-        row_1_y = 50
-        draw.text((12, row_1_y-7), "󰍛", font=self.fonts["icon"], fill=THEME["text_dim"])
-        self.draw_progress_bar(draw, 48, row_1_y + 6, 170, cpu, self.get_color_by_usage(cpu))
-        draw.text((237, row_1_y), f"{cpu:.0f}%", font=self.fonts["value"], fill=THEME["text_main"])
+        self.draw_progress_bar(fb, 24, ROW_1_Y + 3, 85, cpu, self.get_color_by_usage(cpu))
+        self._paste_text(fb, (118, ROW_1_Y), format_percent(cpu), "value", THEME["text_main"], THEME["bg"])
 
         # --------------------------------------------------
         # RAM ROW
         # --------------------------------------------------
-        row_2_y = 86
-        draw.text((12, row_2_y-7), "", font=self.fonts["icon"], fill=THEME["text_dim"])
-        self.draw_progress_bar(draw, 48, row_2_y + 6, 170, ram, self.get_color_by_usage(ram))
-        draw.text((237, row_2_y), f"{ram:.0f}%", font=self.fonts["value"], fill=THEME["text_main"])
+        self.draw_progress_bar(fb, 24, ROW_2_Y + 3, 85, ram, self.get_color_by_usage(ram))
+        self._paste_text(fb, (118, ROW_2_Y), format_percent(ram), "value", THEME["text_main"], THEME["bg"])
 
         # --------------------------------------------------
-        # NETWORK FOOTER — WITH LIGHT GREY BACKGROUND
+        # NETWORK FOOTER
         # --------------------------------------------------
-
-        footer_y = 130                          # Text baseline
-        footer_height = 40 * SCALE              # Adjustable height
-        footer_top = footer_y - (2.5 * SCALE)    # Adjust spacing above icons
-
-        # Light grey footer background (change color here)
-        draw.rectangle(
-            (0, footer_top, self.v_width, footer_top + footer_height),
-            fill="#510909"    # light grey
-        )
-
-        # Icons that always work in Nerd Fonts
-        down_icon = u'\ueb6e' # Material Design Download icon
-        up_icon   = u'\ueb71' # Material Design Upload icon
-
-        def format_mb(value):
-            if value >= 1000:
-                gb = value / 1024
-                return f"{gb:.1f}GB"
-            else:
-                return f"{value}MB"
-
-        # Down
-        draw.text((22, footer_y-5), down_icon, font=self.fonts["net_icon"], fill=THEME["accent_blue"])
-        draw.text((52, footer_y), format_mb(down), font=self.fonts["value"], fill=THEME["text_main"])
-
-        # Up
-        draw.text((170, footer_y-5), up_icon, font=self.fonts["net_icon"], fill=THEME["accent_purple"])
-        draw.text((200, footer_y), format_mb(up), font=self.fonts["value"], fill=THEME["text_main"])
+        self._paste_text(fb, (26, FOOTER_Y), format_mb(down), "value",
+                         THEME["text_main"], THEME["footer_bg"])
+        self._paste_text(fb, (100, FOOTER_Y), format_mb(up), "value",
+                         THEME["text_main"], THEME["footer_bg"])
 
         # --------------------------------------------------
-        # FINAL RESIZE & DISPLAY
+        # DISPLAY (SPI transfer runs on the driver's worker thread)
         # --------------------------------------------------
-        final_img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-        self.display.display(final_img)
+        self.display.display_async(fb)
 
     # --------------------------------------------------
     # MAIN LOOP
@@ -179,12 +404,16 @@ class SystemMonitor:
         try:
             psutil.cpu_percent(None)
             while True:
-                t0 = time.time()
+                t0 = time.monotonic()
                 self.render_frame()
-                time.sleep(max(0.1, UPDATE_INTERVAL - (time.time() - t0)))
+                time.sleep(max(0.1, UPDATE_INTERVAL - (time.monotonic() - t0)))
         except KeyboardInterrupt:
             pass
         finally:
+            for fd in (self._temp_fd, self._net_fd):
+                if fd is not None:
+                    os.close(fd)
+            self._temp_fd = self._net_fd = None
             self.display.close()
 
 # --------------------------------------------------
@@ -1,10 +1,21 @@
+import os
+import sys
+import mmap
 import time
+import queue
 import logging
+import threading
 from typing import Optional, Tuple, List, Union
 
+import numpy as np
 import spidev
 import RPi.GPIO as GPIO
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+try:
+    from numba import njit
+except ImportError:  # optional: the numpy paths below are used instead
+    njit = None
 
 # -----------------------------
 # Low-level ST7735S definitions
@@ -44,13 +55,105 @@ _MADCTL_MY = 0x80
 # Color mode
 _COLMOD_16BIT = 0x05
 
+# BCM283x GPIO registers, as exposed by /dev/gpiomem (32-bit word indices).
+# Used to toggle DC with a single store instead of a RPi.GPIO call.
+_GPIOMEM_PATH = "/dev/gpiomem"
+_GPIOMEM_SIZE = 4096
+_GPSET0 = 0x1C // 4
+_GPCLR0 = 0x28 // 4
+
 # Default display dimensions (0.96" bar: 80x160)
 _DISPLAY_WIDTH = 80
 _DISPLAY_HEIGHT = 160
 
-# SPI transfer limits (avoid OverflowError in kernel driver)
+# SPI clock. Most ST7735S panels are fine at 32 MHz; the Pi derives the
+# actual rate by dividing core_freq, so the effective clock may be lower.
+_SPI_SPEED_HZ = 32_000_000
+_SPI_FALLBACK_SPEED_HZ = 24_000_000
+
+# SPI transfer limits (avoid OverflowError in kernel driver).
+# Only used for list-of-int payloads; bytes go through writebytes2(), which
+# splits on the spidev `bufsiz` module parameter by itself.
 _MAX_SPI_CHUNK = 4096  # Max bytes per SPI transfer
 
+# Per-channel lookup tables for RGB565 packing (big-endian: hi byte, lo byte)
+# hi = RRRRRGGG, lo = GGGBBBBB
+_LUT_R_HI = [v & 0xF8 for v in range(256)]
+_LUT_G_HI = [v >> 5 for v in range(256)]
+_LUT_G_LO = [(v << 3) & 0xE0 for v in range(256)]
+_LUT_B_LO = [v >> 3 for v in range(256)]
+
+
+def _diff_bbox_np(cur: np.ndarray, prev: np.ndarray) -> Tuple[int, int, int, int]:
+    """(x0, y0, x1, y1) bounding box of pixels where cur != prev; x1 == -1 if none."""
+    diff = cur != prev
+    rows = np.flatnonzero(diff.any(axis=1))
+    if rows.size == 0:
+        return 0, 0, -1, -1
+    cols = np.flatnonzero(diff.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])
+
+
+# Fused single-pass kernels, used when numba is installed. They work on
+# native uint16 views of the big-endian frames; the byte swap in
+# _pack_and_diff_nb assumes a little-endian host (every Raspberry Pi is).
+# Only display(PIL image) reaches the pack kernel; RGB565 framebuffers
+# (blit_rgb565 / display_async(ndarray), i.e. the HUD) only use the diff.
+_diff_bbox = _diff_bbox_np
+_pack_and_diff = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _diff_bbox_nb(cur, prev):
+        """Single-pass _diff_bbox_np; no temporary bool array."""
+        h, w = cur.shape
+        x0, y0, x1, y1 = w, h, -1, -1
+        for y in range(h):
+            for x in range(w):
+                if cur[y, x] != prev[y, x]:
+                    if x < x0:
+                        x0 = x
+                    if x > x1:
+                        x1 = x
+                    if y < y0:
+                        y0 = y
+                    y1 = y
+        return x0, y0, x1, y1
+
+    _diff_bbox = _diff_bbox_nb
+
+    if sys.byteorder == "little":
+
+        @njit(cache=True)
+        def _pack_and_diff_nb(rgb, prev, out):
+            """
+            Pack RGB888 into byte-swapped RGB565 `out` and bbox-diff it against `prev`.
+
+            Used by display() for PIL images only; framebuffer blits skip it.
+            """
+            h, w = out.shape
+            x0, y0, x1, y1 = w, h, -1, -1
+            for y in range(h):
+                for x in range(w):
+                    r = np.uint16(rgb[y, x, 0])
+                    g = np.uint16(rgb[y, x, 1])
+                    b = np.uint16(rgb[y, x, 2])
+                    v = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+                    v = ((v & 0xFF) << 8) | (v >> 8)
+                    out[y, x] = v
+                    if v != prev[y, x]:
+                        if x < x0:
+                            x0 = x
+                        if x > x1:
+                            x1 = x
+                        if y < y0:
+                            y0 = y
+                        y1 = y
+            return x0, y0, x1, y1
+
+        _pack_and_diff = _pack_and_diff_nb
+
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert '#RRGGBB' to (R, G, B)."""
@@ -64,14 +167,29 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     )
 
 
+def rgb_to_565(color: Union[Tuple[int, int, int], str]) -> int:
+    """Convert RGB tuple or '#RRGGBB' to 16-bit 565."""
+    if isinstance(color, str):
+        r, g, b = hex_to_rgb(color)
+    else:
+        r, g, b = color
+    r = max(0, min(255, int(r)))
+    g = max(0, min(255, int(g)))
+    b = max(0, min(255, int(b)))
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+
 class ST7735S:
     """
     Driver for ST7735S-based 0.96\" 80x160 TFT display.
 
     Design goals:
-    - Safe SPI chunking (no >4096 byte writes).
-    - Minimal CPU overhead (no numpy; tiny image).
+    - Safe SPI transfers (writebytes2 for buffers, <=4096 byte list chunks).
+    - Minimal CPU overhead (RGB565 packing in PIL's C code, numpy for frame diffs).
     - Simple high-level API: create_canvas(), display(), fill().
+    - RGB565 framebuffer path: image_to_rgb565(), blit_rgb565().
+    - Optional background SPI flush: display_async() / flush(); panel
+      access from the caller and the worker is serialized by a lock.
     """
 
     _DEFAULT_FONT: Optional[ImageFont.FreeTypeFont] = None
@@ -83,7 +201,7 @@ class ST7735S:
         bl: int = 24,
         port: int = 0,
         cs: int = 0,
-        speed_hz: int = 24_000_000,
+        speed_hz: int = _SPI_SPEED_HZ,
         rotation: int = 0,
         invert: bool = False,
         x_offset: int = 24,
@@ -123,6 +241,22 @@ class ST7735S:
         self.height = self.orig_height
         self.rotation = 0
 
+        # Last frame pushed by display(), as an (H, W) RGB565 array.
+        # None means panel contents are unknown and the next frame is sent whole.
+        self._prev_rgb565: Optional[np.ndarray] = None
+
+        # Serializes panel access (window setup + payload, and the frame
+        # cache) between the caller and the background SPI worker. Reentrant
+        # because _recover_spi() calls set_rotation() mid-transaction.
+        self._spi_lock = threading.RLock()
+
+        # Background SPI worker (started on first display_async()).
+        # One pending frame at most; a newer frame replaces an unsent one.
+        self._frame_queue: "queue.Queue[Union[Image.Image, np.ndarray, None]]" = (
+            queue.Queue(maxsize=1)
+        )
+        self._spi_thread: Optional[threading.Thread] = None
+
         # -----------------
         # GPIO setup
         # -----------------
@@ -140,13 +274,20 @@ class ST7735S:
             self.logger.exception("GPIO initialization failed")
             raise
 
+        self._gpio_mm: Optional[mmap.mmap] = None
+        self._gpio_regs: Optional[memoryview] = None
+        self._dc_mask = 1 << self._dc
+        self._map_gpio()
+
         # -----------------
         # SPI setup
         # -----------------
+        self._port = port
+        self._cs = cs
         self.spi = spidev.SpiDev()
         try:
             self.spi.open(port, cs)
-            self.spi.max_speed_hz = speed_hz
+            self._speed_hz = self._set_speed(speed_hz)
             self.spi.mode = 0
             self.spi.lsbfirst = False
         except Exception:
@@ -213,24 +354,79 @@ class ST7735S:
         except Exception:
             self.logger.warning("Backlight control failed", exc_info=True)
 
-    def close(self) -> None:
-        """Release SPI and GPIO resources."""
+    def _map_gpio(self) -> None:
+        """
+        Map the BCM283x GPIO block so DC can be driven via GPSET0/GPCLR0.
+
+        Falls back to RPi.GPIO when /dev/gpiomem is missing or the SoC has a
+        different GPIO block (Pi 5 / RP1).
+        """
+        if self._dc >= 32:
+            return
         try:
-            self.spi.close()
+            with open("/proc/device-tree/compatible", "rb") as f:
+                if b"bcm2712" in f.read():
+                    return
+        except OSError:
+            pass
+
+        try:
+            fd = os.open(_GPIOMEM_PATH, os.O_RDWR | os.O_SYNC)
+        except OSError:
+            self.logger.debug("%s unavailable, using RPi.GPIO for DC", _GPIOMEM_PATH)
+            return
+        try:
+            self._gpio_mm = mmap.mmap(fd, _GPIOMEM_SIZE)
+            self._gpio_regs = memoryview(self._gpio_mm).cast("I")
         except Exception:
-            self.logger.warning("Error closing SPI", exc_info=True)
+            self.logger.warning("GPIO mmap failed, using RPi.GPIO for DC", exc_info=True)
+            self._gpio_mm = None
+            self._gpio_regs = None
         finally:
+            os.close(fd)
+
+    def _dc_low(self) -> None:
+        if self._gpio_regs is not None:
+            self._gpio_regs[_GPCLR0] = self._dc_mask
+        else:
+            GPIO.output(self._dc, GPIO.LOW)
+
+    def _dc_high(self) -> None:
+        if self._gpio_regs is not None:
+            self._gpio_regs[_GPSET0] = self._dc_mask
+        else:
+            GPIO.output(self._dc, GPIO.HIGH)
+
+    def close(self) -> None:
+        """Release SPI and GPIO resources."""
+        if self._spi_thread is not None:
+            self._frame_queue.put(None)
+            self._spi_thread.join(timeout=1.0)
+            self._spi_thread = None
+        # The worker may still be mid-send (recovery alone takes ~1 s); wait
+        # for it to finish. The only thing left queued behind it is None.
+        with self._spi_lock:
             try:
-                GPIO.cleanup([self._dc, self._rst, self._bl])
+                self.spi.close()
             except Exception:
-                self.logger.warning("GPIO cleanup failed", exc_info=True)
+                self.logger.warning("Error closing SPI", exc_info=True)
+            finally:
+                if self._gpio_regs is not None:
+                    self._gpio_regs.release()
+                    self._gpio_mm.close()
+                    self._gpio_regs = None
+                    self._gpio_mm = None
+                try:
+                    GPIO.cleanup([self._dc, self._rst, self._bl])
+                except Exception:
+                    self.logger.warning("GPIO cleanup failed", exc_info=True)
 
     # -------------
     # SPI helpers
     # -------------
     def _write_command(self, command: int) -> None:
         try:
-            GPIO.output(self._dc, GPIO.LOW)
+            self._dc_low()
             self.spi.xfer2([command & 0xFF])
         except Exception:
             self.logger.error("Command write failed", exc_info=True)
@@ -238,14 +434,19 @@ class ST7735S:
 
     def _write_data(self, data: Union[bytes, bytearray, List[int]]) -> None:
         """
-        Send data to the display, chunked so we never exceed _MAX_SPI_CHUNK.
+        Send data to the display.
 
         Accepts:
-          - bytes / bytearray
-          - list of ints (0-255)
+          - bytes / bytearray: sent with a single write-only writebytes2()
+            call (spidev chunks it to `bufsiz` internally, no RX buffer)
+          - list of ints (0-255): chunked so we never exceed _MAX_SPI_CHUNK
         """
         try:
-            GPIO.output(self._dc, GPIO.HIGH)
+            self._dc_high()
+
+            if isinstance(data, (bytes, bytearray)):
+                self.spi.writebytes2(data)
+                return
 
             if isinstance(data, int):
                 data = [data]
@@ -259,14 +460,48 @@ class ST7735S:
             self.logger.error("Data write failed", exc_info=True)
             self._recover_spi()
 
+    def _cmd_then_data(self, command: int, data: bytes = b"") -> None:
+        """
+        Send a command byte and (optionally) its parameter bytes.
+
+        One DC store and one writebytes2() per phase, skipping the per-call
+        type dispatch of _write_command/_write_data. Used on the hot path
+        (window setup before every blit).
+        """
+        try:
+            self._dc_low()
+            self.spi.writebytes2(bytes((command,)))
+            if data:
+                self._dc_high()
+                self.spi.writebytes2(data)
+        except Exception:
+            self.logger.error("Command 0x%02X failed", command, exc_info=True)
+            self._recover_spi()
+
+    def _set_speed(self, speed_hz: int) -> int:
+        """Apply the SPI clock, dropping to the fallback rate if it is rejected."""
+        try:
+            self.spi.max_speed_hz = speed_hz
+            return speed_hz
+        except (IOError, OSError):
+            if speed_hz == _SPI_FALLBACK_SPEED_HZ:
+                raise
+            self.logger.warning(
+                "SPI speed %d Hz rejected, falling back to %d Hz",
+                speed_hz,
+                _SPI_FALLBACK_SPEED_HZ,
+            )
+            self.spi.max_speed_hz = _SPI_FALLBACK_SPEED_HZ
+            return _SPI_FALLBACK_SPEED_HZ
+
     def _recover_spi(self) -> None:
         """Best-effort SPI recovery without killing your app."""
         self.logger.warning("Attempting SPI recovery...")
         try:
             self.spi.close()
             time.sleep(0.1)
-            self.spi.open(0, 0)
-            self.spi.max_speed_hz = 24_000_000
+            self.spi.open(self._port, self._cs)
+            self.spi.max_speed_hz = self._speed_hz
             self.reset()
             self._init_display(False)
             self.set_rotation(self.rotation)
@@ -338,35 +573,43 @@ class ST7735S:
         if rotation not in (0, 90, 180, 270):
             raise ValueError("Rotation must be 0, 90, 180, or 270")
 
-        madctl = _MADCTL_RGB
-
-        if rotation == 0:
-            madctl |= _MADCTL_MX | _MADCTL_MY
-            self.width, self.height = self.orig_width, self.orig_height
-            self._x_offset = self._hw_x_offset
-            self._y_offset = self._hw_y_offset
-        elif rotation == 90:
-            madctl |= _MADCTL_MY | _MADCTL_MV
-            self.width, self.height = self.orig_height, self.orig_width
-            self._x_offset = self._hw_y_offset
-            self._y_offset = self._hw_x_offset
-        elif rotation == 180:
-            # raw panel orientation
-            self.width, self.height = self.orig_width, self.orig_height
-            self._x_offset = self._hw_x_offset
-            self._y_offset = self._hw_y_offset
-        else:  # 270
-            madctl |= _MADCTL_MX | _MADCTL_MV
-            self.width, self.height = self.orig_height, self.orig_width
-            self._x_offset = self._hw_y_offset
-            self._y_offset = self._hw_x_offset
-
-        self._write_command(_CMD_MADCTL)
-        self._write_data([madctl])
-
-        self._set_window(0, 0, self.width - 1, self.height - 1)
-        self.rotation = rotation
-        self.logger.debug("Rotation set to %d°", rotation)
+        with self._spi_lock:
+            madctl = _MADCTL_RGB
+
+            if rotation == 0:
+                madctl |= _MADCTL_MX | _MADCTL_MY
+                self.width, self.height = self.orig_width, self.orig_height
+                self._x_offset = self._hw_x_offset
+                self._y_offset = self._hw_y_offset
+            elif rotation == 90:
+                madctl |= _MADCTL_MY | _MADCTL_MV
+                self.width, self.height = self.orig_height, self.orig_width
+                self._x_offset = self._hw_y_offset
+                self._y_offset = self._hw_x_offset
+            elif rotation == 180:
+                # raw panel orientation
+                self.width, self.height = self.orig_width, self.orig_height
+                self._x_offset = self._hw_x_offset
+                self._y_offset = self._hw_y_offset
+            else:  # 270
+                madctl |= _MADCTL_MX | _MADCTL_MV
+                self.width, self.height = self.orig_height, self.orig_width
+                self._x_offset = self._hw_y_offset
+                self._y_offset = self._hw_x_offset
+
+            self._write_command(_CMD_MADCTL)
+            self._write_data([madctl])
+
+            # Full-screen CASET/RASET payloads only change with rotation
+            x0, x1 = self._x_offset, self._x_offset + self.width - 1
+            y0, y1 = self._y_offset, self._y_offset + self.height - 1
+            self._full_caset = bytes((x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF))
+            self._full_raset = bytes((y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF))
+
+            self._set_full_window()
+            self.rotation = rotation
+            self._prev_rgb565 = None
+            self.logger.debug("Rotation set to %d°", rotation)
 
     def _set_window(self, x0: int, y0: int, x1: int, y1: int) -> None:
         """Set active drawing window."""
@@ -375,86 +618,215 @@ class ST7735S:
         y0 += self._y_offset
         y1 += self._y_offset
 
-        # Column
-        self._write_command(_CMD_CASET)
-        self._write_data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
-
-        # Row
-        self._write_command(_CMD_RASET)
-        self._write_data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
+        # Column, row, then memory write
+        self._cmd_then_data(_CMD_CASET, bytes((x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF)))
+        self._cmd_then_data(_CMD_RASET, bytes((y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF)))
+        self._cmd_then_data(_CMD_RAMWR)
 
-        # Memory write
-        self._write_command(_CMD_RAMWR)
+    def _set_full_window(self) -> None:
+        """Fast path of _set_window() for the whole screen, using cached payloads."""
+        self._cmd_then_data(_CMD_CASET, self._full_caset)
+        self._cmd_then_data(_CMD_RASET, self._full_raset)
+        self._cmd_then_data(_CMD_RAMWR)
 
     # -------------
     # Color helpers
     # -------------
     def _rgb_to_565(self, color: Union[Tuple[int, int, int], str]) -> int:
         """Convert RGB tuple or '#RRGGBB' to 16-bit 565."""
-        if isinstance(color, str):
-            r, g, b = hex_to_rgb(color)
-        else:
-            r, g, b = color
-        r = max(0, min(255, int(r)))
-        g = max(0, min(255, int(g)))
-        b = max(0, min(255, int(b)))
-        return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return rgb_to_565(color)
 
     def _image_to_data(self, image: Image.Image) -> bytes:
         """
         Convert PIL Image (mode 'RGB') to RGB565 byte stream.
 
-        This uses pure Python loops. For 160x80 this is cheap enough and avoids
-        pulling numpy onto the Pi.
+        Each channel goes through a point() lookup table and the two output
+        bytes are interleaved with an 'LA' merge, so no per-pixel work
+        happens in Python.
         """
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        buf = bytearray()
-        append = buf.extend
-
-        for r, g, b in image.getdata():
-            color565 = self._rgb_to_565((r, g, b))
-            append(color565.to_bytes(2, "big"))
+        r, g, b = image.split()
+        hi = ImageChops.add(r.point(_LUT_R_HI), g.point(_LUT_G_HI))
+        lo = ImageChops.add(g.point(_LUT_G_LO), b.point(_LUT_B_LO))
+        return Image.merge("LA", (hi, lo)).tobytes()
 
-        return bytes(buf)
+    def image_to_rgb565(self, image: Image.Image) -> np.ndarray:
+        """Convert a PIL image to an (H, W) big-endian RGB565 array."""
+        rgb565 = np.frombuffer(self._image_to_data(image), dtype=">u2")
+        return rgb565.reshape(image.height, image.width)
 
     # -------------
     # High-level API
     # -------------
-    def display(self, image: Image.Image) -> None:
-        """Blit a PIL image to the panel."""
-        try:
-            if image.size != (self.width, self.height):
-                image = image.resize((self.width, self.height), Image.LANCZOS)
+    def display(self, image: Image.Image, resample: Optional[int] = None) -> None:
+        """
+        Blit a PIL image to the panel (see blit_rgb565).
+
+        Images already at panel size are sent as-is. Others are resized with
+        `resample`; by default NEAREST when the source is an exact integer
+        multiple of the panel (pixel-doubled content, cheapest) and BOX
+        otherwise. Pass Image.Resampling.BOX explicitly for anti-aliased
+        supersampled input, or LANCZOS if quality matters more than CPU.
+        """
+        with self._spi_lock:
+            try:
+                if image.size != (self.width, self.height):
+                    if resample is None:
+                        w, h = image.size
+                        if w % self.width == 0 and h % self.height == 0:
+                            resample = Image.Resampling.NEAREST
+                        else:
+                            resample = Image.Resampling.BOX
+                    image = image.resize((self.width, self.height), resample)
+
+                prev = self._prev_rgb565
+                if _pack_and_diff is not None and prev is not None and prev.shape == (
+                    self.height,
+                    self.width,
+                ):
+                    # One pass: RGB565 pack + dirty bbox, no intermediate arrays
+                    if image.mode != "RGB":
+                        image = image.convert("RGB")
+                    out = np.empty(prev.shape, dtype=np.uint16)
+                    bbox = _pack_and_diff(np.asarray(image), prev.view(np.uint16), out)
+                    if bbox[2] >= 0:
+                        self._send(out.view(">u2"), bbox)
+                    return
+
+                self._blit(self.image_to_rgb565(image))
+            except Exception:
+                self._prev_rgb565 = None
+                self.logger.error("Display update failed", exc_info=True)
 
-            pixel_data = self._image_to_data(image)
+    def blit_rgb565(self, fb: np.ndarray) -> None:
+        """
+        Blit an (H, W) RGB565 framebuffer, sized to the current rotation.
 
-            self._set_window(0, 0, self.width - 1, self.height - 1)
-            self._write_data(pixel_data)
-        except Exception:
-            self.logger.error("Display update failed", exc_info=True)
+        Only the bounding box of pixels that differ from the previous frame
+        is sent; an unchanged frame costs no SPI traffic at all. The array
+        is copied, so the caller may keep drawing into it afterwards.
+        """
+        self._blit_frame(np.array(fb, dtype=">u2"))
+
+    def _blit_frame(self, rgb565: np.ndarray) -> None:
+        """blit_rgb565() for a big-endian array the driver already owns."""
+        with self._spi_lock:
+            try:
+                if rgb565.shape != (self.height, self.width):
+                    raise ValueError(
+                        f"framebuffer shape {rgb565.shape} != {(self.height, self.width)}"
+                    )
+                self._blit(rgb565)
+            except Exception:
+                self._prev_rgb565 = None
+                self.logger.error("Display update failed", exc_info=True)
+
+    @staticmethod
+    def fill_rect_565(
+        fb: np.ndarray, x: int, y: int, w: int, h: int, color565: int
+    ) -> None:
+        """Fill a w x h rectangle of an RGB565 framebuffer (clipped at the far edges)."""
+        fb[y : y + h, x : x + w] = color565
+
+    def _blit(self, rgb565: np.ndarray) -> None:
+        """Send the dirty region of a big-endian (H, W) array we own."""
+        prev = self._prev_rgb565
+        if prev is None or prev.shape != rgb565.shape:
+            self._send(rgb565, None)
+            return
+
+        bbox = _diff_bbox(rgb565.view(np.uint16), prev.view(np.uint16))
+        if bbox[2] >= 0:
+            self._send(rgb565, bbox)
+
+    def _send(
+        self, rgb565: np.ndarray, bbox: Optional[Tuple[int, int, int, int]]
+    ) -> None:
+        """Write the (x0, y0, x1, y1) box of a frame; None sends all of it."""
+        if bbox == (0, 0, self.width - 1, self.height - 1):
+            bbox = None
+
+        # Recorded before the write: SPI recovery resets it to None.
+        self._prev_rgb565 = rgb565
+        if bbox is None:
+            self._set_full_window()
+            self._write_data(rgb565.tobytes())
+        else:
+            x0, y0, x1, y1 = bbox
+            self._set_window(x0, y0, x1, y1)
+            self._write_data(rgb565[y0 : y1 + 1, x0 : x1 + 1].tobytes())
+
+    @property
+    def needs_full_redraw(self) -> bool:
+        """True when panel contents are unknown (init, rotation, fill, SPI recovery)."""
+        return self._prev_rgb565 is None
+
+    def display_async(self, image: Union[Image.Image, np.ndarray]) -> None:
+        """
+        Queue a frame for the background SPI worker and return at once.
+
+        Accepts a PIL image or an RGB565 framebuffer (as for blit_rgb565).
+        The caller can render the next frame while this one is converted and
+        shipped. Framebuffers are snapshotted here, so the caller may reuse
+        its array right away; a PIL image must not be modified once queued.
+        If the worker is still busy with an older unsent frame, that frame
+        is dropped in favour of this one.
+        """
+        if isinstance(image, np.ndarray):
+            image = np.array(image, dtype=">u2")
+
+        if self._spi_thread is None:
+            self._spi_thread = threading.Thread(
+                target=self._spi_worker, name="st7735s-spi", daemon=True
+            )
+            self._spi_thread.start()
 
-    def fill(self, color: Union[Tuple[int, int, int], str, int]) -> None:
-        """Fill the screen with a solid color."""
         try:
-            if isinstance(color, (tuple, str)):
-                color = self._rgb_to_565(color)
+            self._frame_queue.put_nowait(image)
+        except queue.Full:
+            try:
+                self._frame_queue.get_nowait()
+                self._frame_queue.task_done()
+            except queue.Empty:
+                pass
+            self._frame_queue.put_nowait(image)
+
+    def flush(self) -> None:
+        """Block until every queued frame has been sent to the panel."""
+        if self._spi_thread is not None:
+            self._frame_queue.join()
+
+    def _spi_worker(self) -> None:
+        while True:
+            image = self._frame_queue.get()
+            try:
+                if image is None:
+                    return
+                if isinstance(image, np.ndarray):
+                    self._blit_frame(image)
+                else:
+                    self.display(image)
+            finally:
+                self._frame_queue.task_done()
 
-            hi = (color >> 8) & 0xFF
-            lo = color & 0xFF
-            pair = [hi, lo]
+    def fill(self, color: Union[Tuple[int, int, int], str, int]) -> None:
+        """Fill the screen with a solid color."""
+        with self._spi_lock:
+            try:
+                if isinstance(color, (tuple, str)):
+                    color = self._rgb_to_565(color)
 
-            total_pixels = self.width * self.height
-            self._set_window(0, 0, self.width - 1, self.height - 1)
-            GPIO.output(self._dc, GPIO.HIGH)
+                hi = (color >> 8) & 0xFF
+                lo = color & 0xFF
 
-            pixels_per_chunk = _MAX_SPI_CHUNK // 2
-            for offset in range(0, total_pixels, pixels_per_chunk):
-                chunk_size = min(pixels_per_chunk, total_pixels - offset)
-                self.spi.xfer2(pair * chunk_size)
-        except Exception:
-            self.logger.error("Fill operation failed", exc_info=True)
+                total_pixels = self.width * self.height
+                self._prev_rgb565 = None
+                self._set_full_window()
+                self._write_data(bytes((hi, lo)) * total_pixels)
+            except Exception:
+                self.logger.error("Fill operation failed", exc_info=True)
 
     # -------------------------
     # DRAWING CONVENIENCES
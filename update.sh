@@ -9,6 +9,9 @@ cd "$INSTALL_PATH"
 echo ">>> Pulling latest changes from GitHub..."
 git pull
 
+echo ">>> Installing Python dependencies..."
+pip3 install --break-system-packages -r "$INSTALL_PATH/requirements.txt"
+
 echo ">>> Restarting service..."
 sudo systemctl restart "$SERVICE_NAME"
 